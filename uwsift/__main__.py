@@ -387,7 +387,7 @@ class Main(QtWidgets.QMainWindow):
     def dropEvent(self, event):
         LOG.debug("drop event on mainwindow")
         mime = event.mimeData()
-        if mime.hasUrls:
+        if mime.hasUrls():
             event.setDropAction(QtCore.Qt.CopyAction)
             event.accept()
             paths = [str(url.toLocalFile()) for url in mime.urls()]
@@ -39,11 +39,15 @@ class QmlLayerManager(QObject):
         self._convenience_functions: dict[str, Callable] = {
             "Most Frequent": self.get_most_frequent_data_layer_index,
         }
-        self.convFuncModel = LayerModel(layer_strings=list(self._convenience_functions.keys()))  # type: ignore
+        # The models are owned by this manager, give them a Qt parent so their
+        # lifetime is tied to it.
+        self.convFuncModel = LayerModel(  # type: ignore
+            layer_strings=list(self._convenience_functions.keys()), parent=self
+        )
 
         # TODO(mk): make this configurable if the user wants to display dates differently?
         self._format_str = DEFAULT_TIME_FORMAT
-        self._qml_layer_model: LayerModel = LayerModel(layer_strings=["No Layers loaded."])
+        self._qml_layer_model: LayerModel = LayerModel(layer_strings=["No Layers loaded."], parent=self)
 
     def get_most_frequent_data_layer_index(self) -> int:
         """
@@ -59,16 +63,19 @@ class QmlLayerManager(QObject):
         else:
             temporal_differences = np.zeros(num_data_layers)
             for i, dynamic_layer in enumerate(dynamic_layers):
-                tl = list(dynamic_layer.timeline.keys())
-                t_diffs = [tl[i + 1] - tl[i] for i in range(len(tl) - 1)]
+                timestamps = dynamic_layer.timeline.keys()
                 # Calculate mean difference in timeline in seconds to support
                 # comparing timelines with non-regularly occurring
-                # timestamps. Timelines with zero or one entries (=> t_diffs
-                # is empty) are not suitable, assign the largest possible mean
-                # value for them!
-                temporal_differences[i] = (
-                    sys.float_info.max if not t_diffs else np.mean(list(map(lambda td: td.total_seconds(), t_diffs)))
-                )
+                # timestamps. Timelines with zero or one entries are not
+                # suitable, assign the largest possible mean value for them!
+                # The sum of the differences of consecutive timestamps
+                # telescopes to last - first, thus neither a copy of the
+                # timeline nor the single differences are needed.
+                if len(timestamps) < 2:
+                    temporal_differences[i] = sys.float_info.max
+                else:
+                    first_t, last_t = next(iter(timestamps)), next(reversed(timestamps))
+                    temporal_differences[i] = (last_t - first_t).total_seconds() / (len(timestamps) - 1)
             most_frequent_data_layer_idx = np.argmin(temporal_differences)
             if not isinstance(most_frequent_data_layer_idx, np.int64):
                 # If there exist multiple timelines at the same sampling rate,
@@ -147,7 +154,7 @@ class LayerModel(QAbstractListModel):
         data_size = len(data)
         if data_size > 1:
             start_idx = self.rowCount()
-            end_idx = start_idx + data_size
+            end_idx = start_idx + data_size - 1
             self.beginInsertRows(QModelIndex(), start_idx, end_idx)
             self._layer_strings.extend(data)
             self.endInsertRows()
@@ -164,8 +171,11 @@ class LayerModel(QAbstractListModel):
         self.pushedOrPopped.emit()
 
     def clear(self):
-        for row, _ in enumerate(self._layer_strings):
-            self.pop(row)
+        """Remove all entries by resetting the model."""
+        self.beginResetModel()
+        self._layer_strings = []
+        self.endResetModel()
+        self.pushedOrPopped.emit()
 
     @property
     def layer_strings(self):
@@ -221,6 +231,11 @@ class TimebaseModel(QAbstractListModel):
     def at(self, i):
         return self._timestamps[i]
 
+    @pyqtProperty("QVariantList", notify=timebaseChanged)
+    def timestampsMsecs(self):
+        """Timestamps as milliseconds since epoch, to be fetched by QML in one go instead of calling at() per index."""
+        return self._timestamps_msecs
+
     @pyqtProperty(str, notify=currentTimestampChanged)
     def currentTimestamp(self):
         return self._current_timestamp
@@ -238,6 +253,7 @@ class TimebaseModel(QAbstractListModel):
     def timestamps(self, timestamps):
         self.layoutAboutToBeChanged.emit()
         self._timestamps = timestamps if timestamps else self._get_default_qdts()
+        self._timestamps_msecs = [qdt.toMSecsSinceEpoch() for qdt in self._timestamps]
         # upd. persistent indexes
         from_index_list = self.persistentIndexList()
         to_index_list = []
@@ -4,20 +4,26 @@ from typing import List, Optional
 import numpy as np
 
 
+def _as_datetime64(times) -> np.ndarray:
+    # datetime64 arrays are int64 under the hood, thus comparisons and
+    # differences are vectorized instead of being done per Python datetime.
+    return np.asarray(times, dtype="datetime64[us]")
+
+
 # Example time Matching policies
 def find_nearest(ref: List[datetime], query: datetime) -> Optional[datetime]:
-    ref_np = np.asarray(ref)
-    query_np = np.asarray(query)
-    distances = np.abs(ref_np - query_np)
-    return ref_np[np.argmin(distances)]
+    ref = list(ref)
+    distances = np.abs(_as_datetime64(ref) - np.datetime64(query, "us"))
+    return ref[np.argmin(distances)]
 
 
 def find_nearest_past(ref: List[datetime], query: datetime) -> Optional[datetime]:
-    query_np = np.asarray(query)
-    ref_np = np.array([t for t in ref])
-    past_idcs = ref_np <= query_np
-    if np.any(past_idcs):
-        distances = np.abs(ref_np[past_idcs] - query_np)
-        return ref_np[np.argmin(distances)]
+    ref = list(ref)
+    ref_np = _as_datetime64(ref)
+    query_np = np.datetime64(query, "us")
+    past_idcs = np.flatnonzero(ref_np <= query_np)
+    if past_idcs.size > 0:
+        distances = query_np - ref_np[past_idcs]
+        return ref[past_idcs[np.argmin(distances)]]
     else:
         return None
@@ -46,7 +46,7 @@ class TimeManager(QObject):
         self.qml_layer_manager: QmlLayerManager = QmlLayerManager()
         self.current_timebase_uuid = None
 
-        self.qml_timestamps_model = TimebaseModel(timestamps=None)
+        self.qml_timestamps_model = TimebaseModel(timestamps=None, parent=self)
         self._time_transformer: Optional[TimeTransformer] = None
 
     @property
@@ -221,7 +221,7 @@ class TimeManager(QObject):
     def tick_qml_state(self, t_sim, timeline_idx):  # noqa D102 MAKE_PRIVATE
         # TODO(mk): if TimeManager is subclassed the behavior below must be adapted:
         #           it may no longer be desirable to show t_sim as the current time step
-        self.qml_timestamps_model.currentTimestamp = self._time_transformer.t_sim
+        self.qml_timestamps_model.currentTimestamp = t_sim
         self.qml_backend.doNotifyTimelineIndexChanged.emit(timeline_idx)
 
     def create_formatted_t_sim(self):
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+import pytest
+from PyQt5.QtCore import QDateTime
+
+from uwsift.control.qml_utils import LayerModel, QmlLayerManager, TimebaseModel
+
+
+def test_timebase_model_timestamps_msecs():
+    qdts = [QDateTime(datetime(2023, 1, 1, 12, minute)) for minute in (0, 15, 30)]
+    model = TimebaseModel(timestamps=qdts)
+    assert model.timestampsMsecs == [qdt.toMSecsSinceEpoch() for qdt in qdts]
+    assert model.timestampsMsecs[1] - model.timestampsMsecs[0] == 15 * 60 * 1000
+
+    model.timestamps = None  # falls back to default timestamps
+    assert len(model.timestampsMsecs) == model.rowCount()
+
+
+def test_layer_model_push_and_clear():
+    model = LayerModel(layer_strings=["a"])
+    notifications = []
+    model.pushedOrPopped.connect(lambda: notifications.append(True))
+
+    model.push(["b", "c", "d"])
+    assert model.layer_strings == ["a", "b", "c", "d"]
+    assert len(notifications) == 1
+
+    model.clear()
+    assert model.rowCount() == 0
+    assert len(notifications) == 2
+
+
+class _FakeLayer:
+    def __init__(self, minutes):
+        self.timeline = {datetime(2023, 1, 1, 12) + timedelta(minutes=m): None for m in minutes}
+
+
+class _FakeLayerModel:
+    def __init__(self, layers):
+        self._layers = layers
+
+    def get_dynamic_layers(self):
+        return self._layers
+
+
+@pytest.mark.parametrize(
+    "layer_minutes, expected",
+    [
+        ([], -1),  # no dynamic layers at all
+        ([[0, 15, 30], [0, 5, 20, 30]], 1),  # mean distance 15 min vs. 10 min
+        ([[0], [0, 30, 60]], 1),  # single timestamp timelines are never the most frequent
+        ([[0, 10], [0, 10, 20]], 0),  # equal sampling rate, take the first
+    ],
+)
+def test_get_most_frequent_data_layer_index(layer_minutes, expected):
+    layer_manager = QmlLayerManager()
+    layer_manager._layer_model = _FakeLayerModel([_FakeLayer(minutes) for minutes in layer_minutes])
+    assert layer_manager.get_most_frequent_data_layer_index() == expected
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from uwsift.control.time_matcher_policies import find_nearest, find_nearest_past
+
+T0 = datetime(2023, 1, 1, 12)
+TIMELINE = [T0 + timedelta(minutes=m) for m in (0, 15, 30, 45)]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (T0 - timedelta(minutes=5), T0),  # before the timeline
+        (T0 + timedelta(minutes=20), T0 + timedelta(minutes=15)),
+        (T0 + timedelta(minutes=25), T0 + timedelta(minutes=30)),
+        (T0 + timedelta(hours=2), T0 + timedelta(minutes=45)),  # after the timeline
+    ],
+)
+def test_find_nearest(query, expected):
+    assert find_nearest(TIMELINE, query) == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (T0 - timedelta(minutes=5), None),  # no past timestamp
+        (T0 + timedelta(minutes=15), T0 + timedelta(minutes=15)),  # exact match
+        (T0 + timedelta(minutes=29), T0 + timedelta(minutes=15)),
+        (T0 + timedelta(hours=2), T0 + timedelta(minutes=45)),
+    ],
+)
+def test_find_nearest_past(query, expected):
+    assert find_nearest_past(TIMELINE, query) == expected
+
+
+def test_find_nearest_past_returns_timeline_key():
+    timeline = {t: str(t) for t in TIMELINE}
+    t_matched = find_nearest_past(timeline, T0 + timedelta(minutes=40))
+    assert isinstance(t_matched, datetime)
+    assert timeline[t_matched] == str(T0 + timedelta(minutes=30))
@@ -37,6 +37,8 @@ Rectangle{
         property int temp_idx: -1;
         property var tickBlueprints: [];
         property var tickDates: [];
+        // label texts of tickDates, cached as they don't change on resize
+        property var tickLabels: [];
         property var tickMargin: 10;
         property var resolution: 30;
         property var resolutionMode: "Minutes";
@@ -46,6 +48,10 @@ Rectangle{
         // TODO(mk): attach signal/event handler to tickFontSize to recalculate textMargin
         property var textMargin: 90;
         property var rulerYPosition: timestamp_rect.height + 0.5;
+        // time to pixel transform of the ruler, see timeToX()
+        property real originMsecs: 0;
+        property real pxPerMsec: 0;
+        property color rulerColor: Qt.darker(timeline_rect.color, 2.0);
         // Signal declarations
         // Javascript functions
         function clear_canvas(context) {
@@ -78,8 +84,15 @@ Rectangle{
             return nextDateByResolution(date, -resolution, resolutionMode);
         }
 
-        function buildTickBlueprints(){
-            timelineRulerCanvas.tickBlueprints = []
+        function timeToX(msecs){
+            // Pixel position on the ruler of a time given in milliseconds since epoch
+            return (pxPerMsec*(msecs-originMsecs)) + tickMargin;
+        }
+
+        function buildTickDates(){
+            // Tick dates and their labels only depend on the timebase, not on the
+            // canvas geometry. Thus they are computed once per timebase change and
+            // reused by buildTickBlueprints() on every resize.
 
             // Assume temporally sorted timebaseModel
             let numDts = timebaseModel.rowCount()
@@ -95,7 +108,6 @@ Rectangle{
             if (maxTickIndex === 0){
                 maxTickIndex = 1;
             }
-            timelineRulerCanvas.tickWidth = ((timelineRulerCanvas.width-timelineRulerCanvas.textMargin) / maxTickIndex);
             let tickDts = [firstDate];
             for(var k=1; k<=maxTickIndex; k++){
                 let nextTickDt = nextDateByResolution(tickDts[k-1], resolution, resolutionMode);
@@ -103,48 +115,53 @@ Rectangle{
 
             }
 
-            timelineRulerCanvas.tickDates = tickDts;
-
-            // figure out temporal res. and scale accordingly
-            let ticks = timelineRulerCanvas.tickDates
-            for(var i=0; i < ticks.length; i++){
-                let tickBP = {"X": 1.0,"Y":1.0,"TextX":1.0,"TextY":1.0,"Length":1.0,"Major":false, "Text":""};
+            let labels = [];
+            for(var i=0; i < tickDts.length; i++){
                 // major or minor tick
-                let dCurr = ticks[i];
+                let dCurr = tickDts[i];
                 let dCurrDay = dCurr.getDate();
                 let dPrev;
                 if (i === 0){
                     dPrev = previousDateByResolution(dCurr, resolution, resolutionMode);
                 }else{
-                    dPrev = ticks[i-1];
+                    dPrev = tickDts[i-1];
                 }
                 let dprevDay = dPrev.getDate();
-                if ((dPrev < dCurr) && (dprevDay < dCurrDay)){
-                    // Major tick
-                    // Event handlers (such as onWidthChanged may be called more than once,
-                    // thus no mutating global state
-                    tickBP = createTickBlueprint(i, dCurr, true);
-                }else{
-                    tickBP = createTickBlueprint(i, dCurr, false);
-                }
-                timelineRulerCanvas.tickBlueprints.push(tickBP);
+                // Major tick if the day changes, the first tick is always a major one
+                let majorTick = ((dPrev < dCurr) && (dprevDay < dCurrDay)) || (i === 0);
+                labels.push({"Major": majorTick,
+                             "Text": Qt.formatDateTime(dCurr, "hh:mm"),
+                             "MajorText": majorTick ? Qt.formatDateTime(dCurr, "d MMM yyyy") : ""});
             }
+
+            timelineRulerCanvas.tickDates = tickDts;
+            timelineRulerCanvas.tickLabels = labels;
         }
 
-        function createTickBlueprint(index, tickDate, majorTick){
-            let tickBP = {"X": 1.0,"Y":1.0,"TextX":1.0,"TextY":1.0,"Length":1.0,"Major":false, "Text":"", "MajorText":"","MajorTextY": timelineRulerCanvas.majorTickFontsize};
-            if (majorTick || (index === 0)){
-                tickBP.Major = true;
-                tickBP.MajorText += Qt.formatDateTime(tickDate, "d MMM yyyy");
-                tickBP.Y = 0;
-                tickBP.Length = height;
-            }else{
-                // Minor tick
-                tickBP.Y = height/4;
-                tickBP.Length = height;
+        function buildTickBlueprints(){
+            if (tickDates.length === 0){
+                buildTickDates();
+            }
+            let ticks = timelineRulerCanvas.tickDates;
+            timelineRulerCanvas.tickWidth = ((timelineRulerCanvas.width-timelineRulerCanvas.textMargin) / (ticks.length-1));
+            timelineRulerCanvas.originMsecs = ticks[0].getTime();
+            timelineRulerCanvas.pxPerMsec = tickWidth/(ticks[1].getTime()-ticks[0].getTime());
+
+            // Event handlers (such as onWidthChanged may be called more than once,
+            // thus no mutating global state
+            let tickBPs = [];
+            for(var i=0; i < ticks.length; i++){
+                tickBPs.push(createTickBlueprint(i, timelineRulerCanvas.tickLabels[i]));
             }
+            timelineRulerCanvas.tickBlueprints = tickBPs;
+        }
+
+        function createTickBlueprint(index, tickLabel){
+            let tickBP = {"X": 1.0,"Y":1.0,"TextX":1.0,"TextY":1.0,"Length":height,"Major":tickLabel.Major,
+                          "Text":tickLabel.Text, "MajorText":tickLabel.MajorText,"MajorTextY": timelineRulerCanvas.majorTickFontsize};
+            // Minor ticks start below the major tick labels
+            tickBP.Y = tickLabel.Major ? 0 : height/4;
             tickBP.X = Math.round(timelineRulerCanvas.tickMargin + index*tickWidth) + 0.5;
-            tickBP.Text += Qt.formatDateTime(tickDate, "hh:mm");
             tickBP.TextX = tickBP.X + 2;
             tickBP.TextY = rulerYPosition - 1;
             return tickBP;
@@ -162,8 +179,9 @@ Rectangle{
             //       Solution: Create a Resources.qml (or any compatible name, must start with Capital letter)
             //                 and include it as a child object wherever resources of some kind are needed.
 
+            // All tick lines are collected into one path which is stroked only once
+            context.beginPath();
             timelineRulerCanvas.tickBlueprints.forEach((item, index) => {
-                context.beginPath();
                 context.moveTo(item.X, item.Y);
                 context.lineTo(item.X, item.Y + item.Length);
                 if (item.Major){
@@ -173,19 +191,20 @@ Rectangle{
                 }else{
                     context.fillText(item.Text, item.TextX, item.TextY-textPaddingBottom);
                 }
-
-                context.stroke();
             });
+            context.stroke();
         }
 
         // Object properties
         anchors.fill: parent
         renderStrategy: Canvas.Threaded
+        // The ruler keeps the default Canvas.Image render target, text drawn into
+        // a Canvas.FramebufferObject is rendered poorly.
 
         onPaint:{
             var context = getContext("2d");
             context.reset()
-            context.strokeStyle = Qt.darker(timeline_rect.color, 2.0)
+            context.strokeStyle = rulerColor
             context.lineWidth = 1;
             // Draw horizontal ray
             context.moveTo(0, rulerYPosition);
@@ -214,6 +233,7 @@ Rectangle{
             target: timebaseModel
             function onTimebaseChanged() {
                 timelineRulerCanvas.calculate_resolution();
+                timelineRulerCanvas.buildTickDates();
                 timelineRulerCanvas.buildTickBlueprints();
                 timelineRulerCanvas.requestPaint();
             }
@@ -222,6 +242,7 @@ Rectangle{
             buildTickBlueprints();
             requestPaint();
         }
+        onRulerColorChanged: requestPaint();
         FontLoader {
             id: siftFont;//"Sans Serif"
             source: Qt.resolvedUrl("../data/fonts/Andale Mono.ttf");//"qrc:/AndaleMono.ttf"
@@ -237,122 +258,107 @@ Rectangle{
         id: timelineMarkerCanvas;
 
         // Property declarations
-        property var currIndex: 0
-        property var cursorX: 0
-        property var cursorY: 0
         // marker radius actually used to define bounding box of rounded rect
         property var markerRadius: 10
         property var markerYPosition: (3/4)*(height) - (markerRadius / 2);
         property bool dataLoaded: false;
-        property var markerBluePrints: []
+        // Marker centers on the x axis, sorted by time. All other marker geometry
+        // is the same for each marker and derived from markerRadius.
+        property var markerCenterXs: new Float64Array(0)
+        property color markerColor: Qt.darker(Qt.rgba(1, 0, 0, 1), 1)
 
         // signals
-        signal reemittedTimelineIndexChanged(var idx);
         signal reemittedRefreshTimeline();
         // JS functions
-        function calculateTickWidthPerTime(ticks){
-            let tickWidthPerTime;
-            if (ticks.length === 1){
-                let nextTick = timelineRulerCanvas.nextDateByResolution(ticks[0], timelineRulerCanvas.resolution, timelineRulerCanvas.resolutionMode);
-                tickWidthPerTime = timelineRulerCanvas.tickWidth/(nextTick.getTime()-ticks[0].getTime());
-            }else{
-                tickWidthPerTime = timelineRulerCanvas.tickWidth/(ticks[1].getTime()-ticks[0].getTime());
+        function findNearestMarkerIndex(x){
+            // The markers are sorted by time and thus by x, so the marker
+            // closest to x is found by binary search.
+            let xs = timelineMarkerCanvas.markerCenterXs;
+            if (xs.length === 0){
+                return -1;
             }
-            return tickWidthPerTime;
-        }
-
-        function updateTimelineCursorPosition(){
-            let resolution = timelineRulerCanvas.resolution;
-            let resolutionMode = timelineRulerCanvas.resolutionMode;
-            let ticks = timelineRulerCanvas.tickDates;
-            let tickWidthPerTime = calculateTickWidthPerTime(ticks);
-            let markerDate = timebaseModel.at(currIndex);
-            let timeOffset = markerDate.getTime()-ticks[0].getTime();
-            let markerWidth = timelineMarkerCanvas.markerBluePrints[0].W;
-            timelineMarkerCanvas.cursorX = (tickWidthPerTime*timeOffset) + timelineRulerCanvas.tickMargin;
-            timelineMarkerCanvas.cursorY = timelineRulerCanvas.rulerYPosition;
-        }
-
-        function createMarkerBlueprint(index, markerDate){
-            let markerBP = {"X": 1.0,"Y":1.0,"W": 1.0, "H":1.0, "R": 1.0};
-            markerBP.W = markerRadius;
-            markerBP.H = markerBP.W;
-            markerBP.R = markerBP.W * 0.5;
-
-            let resolution = timelineRulerCanvas.resolution;
-            let resolutionMode = timelineRulerCanvas.resolutionMode;
-            let ticks = timelineRulerCanvas.tickDates;
-            let tickWidthPerTime = calculateTickWidthPerTime(ticks);
-            let timeOffset = markerDate.getTime()-ticks[0].getTime();
-            markerBP.X = (tickWidthPerTime*timeOffset) + timelineRulerCanvas.tickMargin - (markerBP.W/2);
-            markerBP.Y = markerYPosition;
-
-            return markerBP;
+            let lo = 0;
+            let hi = xs.length;
+            while (lo < hi){
+                let mid = (lo + hi) >> 1;
+                if (xs[mid] < x){
+                    lo = mid + 1;
+                }else{
+                    hi = mid;
+                }
+            }
+            if (lo === xs.length){
+                return lo - 1;
+            }
+            if ((lo > 0) && (x - xs[lo-1] <= xs[lo] - x)){
+                return lo - 1;
+            }
+            return lo;
         }
 
-        function updateMarkerBlueprints(){
-            timelineMarkerCanvas.markerBluePrints = [];
-
-            for(var i=0; i < timebaseModel.rowCount(); i++){
-                timelineMarkerCanvas.markerBluePrints.push(createMarkerBlueprint(i, timebaseModel.at(i)));
+        function updateMarkerPositions(){
+            // Fetch all timestamps at once instead of calling timebaseModel.at() per marker
+            let markerTimes = timebaseModel.timestampsMsecs;
+            let xs = new Float64Array(markerTimes.length);
+            for(var i=0; i < markerTimes.length; i++){
+                xs[i] = timelineRulerCanvas.timeToX(markerTimes[i]);
             }
+            // Assign the finished array at once, so that onMarkerCenterXsChanged
+            // handlers only ever see complete marker positions.
+            timelineMarkerCanvas.markerCenterXs = xs;
         }
 
         // object properties
         anchors.fill: parent;
         renderStrategy: Canvas.Threaded
+        // Only shapes are drawn here, let the GPU rasterize them. Qt falls back to
+        // Canvas.Image where no OpenGL context is available (software backend).
+        renderTarget: Canvas.FramebufferObject
 
+        // The markers only change with the timebase or the canvas geometry, thus
+        // they are painted here once and kept as cached canvas image. The cursor,
+        // which moves on every animation step, is painted by timelineCursorCanvas.
         onPaint: {
             var context = getContext("2d");
             context.reset();
 
             if (dataLoaded){
-                updateTimelineCursorPosition()
-                let markerColor = Qt.darker(Qt.rgba(1, 0, 0, 1), 1);
                 context.strokeStyle = markerColor;
-                context.fillStyle = markerColor;
                 context.lineWidth = 2;
-                markerBluePrints.forEach((bp)=>{
-                    context.beginPath();
-                    context.roundedRect(bp.X, bp.Y, bp.W, bp.H, bp.R, bp.R);
-                    context.stroke();
-                });
+                let markerWidth = markerRadius;
+                let markerHalfWidth = markerWidth * 0.5;
+                // All markers are collected into one path which is stroked only once
                 context.beginPath();
-
-                // draw Cursor
-                let cursorWidth = 11
-                let cursorYOffset = Math.round(cursorWidth/2)-1
-                context.moveTo(cursorX, cursorY-cursorYOffset);
-                context.lineTo(cursorX, markerYPosition+1.5*markerRadius);
-                context.fillRect(cursorX-5, cursorY-cursorYOffset, cursorWidth, cursorWidth);
+                for (var i=0; i < markerCenterXs.length; i++){
+                    let markerX = markerCenterXs[i] - markerHalfWidth;
+                    context.roundedRect(markerX, markerYPosition, markerWidth, markerWidth,
+                                        markerHalfWidth, markerHalfWidth);
+                }
                 context.stroke();
             }
 
         }
 
-        onReemittedTimelineIndexChanged: {
-            currIndex = idx;
-            requestPaint();
-        }
         onReemittedRefreshTimeline: {
-            timelineMarkerCanvas.updateMarkerBlueprints();
+            timelineMarkerCanvas.updateMarkerPositions();
             timelineMarkerCanvas.requestPaint();
         }
+        onMarkerColorChanged: requestPaint();
         // Connections
         Connections{
             target: timelineRulerCanvas
             function onWidthChanged() {
-                timelineMarkerCanvas.updateMarkerBlueprints();
+                timelineMarkerCanvas.updateMarkerPositions();
                 timelineMarkerCanvas.requestPaint();
             }
         }
         Connections{
             target: timebaseModel
+            // The marker positions are not recomputed here: TimeManager always follows a
+            // timebase change with doRefreshTimeline, at which point the ruler
+            // ticks are guaranteed to be up to date as well.
             function onTimebaseChanged() {
                 timelineMarkerCanvas.dataLoaded = true
-                timelineMarkerCanvas.currIndex = 0;
-                timelineMarkerCanvas.updateMarkerBlueprints();
-                timelineMarkerCanvas.requestPaint();
             }
         }
 
@@ -364,10 +370,115 @@ Rectangle{
         }
 
         Component.onCompleted: {
-            backend.doNotifyTimelineIndexChanged.connect(reemittedTimelineIndexChanged);
             backend.doRefreshTimeline.connect(reemittedRefreshTimeline);
         }
     }
+    Canvas{
+        // Id
+        id: timelineCursorCanvas;
+
+        // Property declarations
+        property var currIndex: 0
+        property var cursorX: 0
+        property var cursorY: 0
+        property var cursorWidth: 11
+
+        // signals
+        signal reemittedTimelineIndexChanged(var idx);
+        // JS functions
+        function cursorDirtyRect(){
+            // Horizontal extent of the cursor square and line, plus some slack
+            return Qt.rect(cursorX - cursorWidth/2 - 2, 0, cursorWidth + 4, height);
+        }
+
+        function moveCursorTo(idx){
+            // No markers, thus no position to move the cursor to
+            if (idx < 0){
+                return;
+            }
+            // Mark the old and the new cursor area dirty. Canvas merges both into
+            // one bounding rect, so the repainted region spans everything between
+            // the two positions: narrow for single steps, but the full canvas
+            // width when the animation wraps from the last to the first index.
+            markDirty(cursorDirtyRect());
+            currIndex = idx;
+            if (currIndex < timelineMarkerCanvas.markerCenterXs.length){
+                updateTimelineCursorPosition();
+                markDirty(cursorDirtyRect());
+            }
+        }
+
+        function updateTimelineCursorPosition(){
+            // The cursor sits on the center of the current marker, whose position
+            // has already been computed via timelineRulerCanvas.timeToX()
+            timelineCursorCanvas.cursorX = timelineMarkerCanvas.markerCenterXs[currIndex];
+            timelineCursorCanvas.cursorY = timelineRulerCanvas.rulerYPosition;
+        }
+
+        // object properties
+        anchors.fill: parent;
+        renderStrategy: Canvas.Threaded
+        // see timelineMarkerCanvas
+        renderTarget: Canvas.FramebufferObject
+        // The cursor consists of axis-aligned shapes only, antialiasing them just
+        // costs painting time on every animation step.
+        antialiasing: false
+
+        onPaint: {
+            var context = getContext("2d");
+            // Restrict clearing and drawing to the dirty region, which is the whole
+            // canvas after requestPaint() and the span between the old and the new
+            // cursor position for moveCursorTo()
+            context.save();
+            context.beginPath();
+            context.rect(region.x, region.y, region.width, region.height);
+            context.clip();
+            context.clearRect(region.x, region.y, region.width, region.height);
+
+            if (timelineMarkerCanvas.dataLoaded && (currIndex < timelineMarkerCanvas.markerCenterXs.length)){
+                updateTimelineCursorPosition()
+                let markerColor = timelineMarkerCanvas.markerColor;
+                let markerRadius = timelineMarkerCanvas.markerRadius;
+                let markerYPosition = timelineMarkerCanvas.markerYPosition;
+                context.strokeStyle = markerColor;
+                context.fillStyle = markerColor;
+                context.lineWidth = 2;
+                context.beginPath();
+
+                // draw Cursor
+                let cursorYOffset = Math.round(cursorWidth/2)-1
+                context.moveTo(cursorX, cursorY-cursorYOffset);
+                context.lineTo(cursorX, markerYPosition+1.5*markerRadius);
+                context.fillRect(cursorX-5, cursorY-cursorYOffset, cursorWidth, cursorWidth);
+                context.stroke();
+            }
+            context.restore();
+        }
+
+        onReemittedTimelineIndexChanged: {
+            moveCursorTo(idx);
+        }
+        // Connections
+        Connections{
+            target: timelineMarkerCanvas
+            function onMarkerCenterXsChanged() {
+                timelineCursorCanvas.requestPaint();
+            }
+            function onMarkerColorChanged() {
+                timelineCursorCanvas.requestPaint();
+            }
+        }
+        Connections{
+            target: timebaseModel
+            function onTimebaseChanged() {
+                timelineCursorCanvas.currIndex = 0;
+            }
+        }
+
+        Component.onCompleted: {
+            backend.doNotifyTimelineIndexChanged.connect(reemittedTimelineIndexChanged);
+        }
+    }
     MouseArea{
         id: mouse_area
         property var prevIndex: 0;
@@ -381,22 +492,10 @@ Rectangle{
             if (!timelineMarkerCanvas.dataLoaded)
                 return;
 
-            let markerCenterXs = []
-            for (var i=0; i<timelineMarkerCanvas.markerBluePrints.length;++i){
-                let markerCenterX =
-                    timelineMarkerCanvas.markerBluePrints[i].X + timelineMarkerCanvas.markerBluePrints[i].R;
-                markerCenterXs.push(markerCenterX);
-            }
-
-            let distVals = markerCenterXs.map((markerCenterX)=>{
-                return Math.abs(mouseX - markerCenterX)
-            });
-            let val = Math.min(...distVals);
-            let clickedIndex = distVals.indexOf(val)
+            let clickedIndex = timelineMarkerCanvas.findNearestMarkerIndex(mouseX);
 
             backend.clickTimelineAtIndex(clickedIndex);
-            timelineMarkerCanvas.currIndex = clickedIndex;
-            timelineMarkerCanvas.requestPaint();
+            timelineCursorCanvas.moveCursorTo(clickedIndex);
         }
     }
 }
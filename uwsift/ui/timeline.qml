@@ -158,8 +158,11 @@ Item{
 
                 onReemittedPushedOrPopped:{
                     textWidths = [];
-                    for(var i = 0; i < model.rowCount(); i++) {
-                        comboBoxTextMetrics.text = this.model.model[i];
+                    // Fetch the layer names only once: every access to model.model
+                    // converts the whole list on the Python side.
+                    let layerStrings = model.model;
+                    for(var i = 0; i < layerStrings.length; i++) {
+                        comboBoxTextMetrics.text = layerStrings[i];
                         let curr_width = comboBoxTextMetrics.width;
                         if (curr_width === NaN){
                             continue;
@@ -992,8 +992,9 @@ class SceneGraphManager(QObject):
         # presentation are applied to the new image node
         self.apply_presentation_to_image_node(image, layer.presentation)
         self.on_view_change(None)
-        LOG.debug("Scene Graph after IMAGE dataset insertion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after IMAGE dataset insertion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def add_node_for_mc_image_dataset(self, layer: LayerItem, product_dataset: ProductDataset) -> None:
         """Create and add a new node for a multichannel images to the SceneGraphManager.
@@ -1060,8 +1061,9 @@ class SceneGraphManager(QObject):
             )
         self.dataset_nodes[product_dataset.uuid] = image
         self.on_view_change(None)
-        LOG.debug("Scene Graph after MC IMAGE dataset insertion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after MC IMAGE dataset insertion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def add_node_for_composite_dataset(self, layer: LayerItem, product_dataset: ProductDataset):
         assert self.layer_nodes[layer.uuid] is not None  # nosec B101
@@ -1128,8 +1130,9 @@ class SceneGraphManager(QObject):
         self.composite_element_dependencies[product_dataset.uuid] = product_dataset.input_datasets_uuids
         self.dataset_nodes[product_dataset.uuid] = composite
         self.on_view_change(None)
-        LOG.debug("Scene Graph after COMPOSITE dataset insertion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after COMPOSITE dataset insertion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def add_node_for_lines_dataset(self, layer: LayerItem, product_dataset: ProductDataset) -> scene.VisualNode:
         assert self.layer_nodes[layer.uuid] is not None  # nosec B101
@@ -1146,8 +1149,9 @@ class SceneGraphManager(QObject):
 
         self.dataset_nodes[product_dataset.uuid] = lines
         self.on_view_change(None)
-        LOG.debug("Scene Graph after LINES dataset insertion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after LINES dataset insertion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def add_node_for_points_dataset(self, layer: LayerItem, product_dataset: ProductDataset) -> scene.VisualNode:
         assert self.layer_nodes[layer.uuid] is not None  # nosec B101
@@ -1172,8 +1176,9 @@ class SceneGraphManager(QObject):
 
         self.dataset_nodes[product_dataset.uuid] = points
         self.on_view_change(None)
-        LOG.debug("Scene Graph after POINTS dataset insertion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after POINTS dataset insertion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def map_to_colors_autoscaled(self, colormap, values, m=2):
         """Get a list of colors by mapping each entry in values by the given colormap.
@@ -1304,8 +1309,9 @@ class SceneGraphManager(QObject):
             LOG.info(f"dataset {uuid_removed} purge from Scene Graph")
         else:
             LOG.debug(f"dataset {uuid_removed} already purged from Scene Graph")
-        LOG.debug("Scene Graph after dataset deletion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after dataset deletion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def remove_layer_node(self, uuid_removed: UUID):
         """
@@ -1319,8 +1325,9 @@ class SceneGraphManager(QObject):
             LOG.info(f"layer {uuid_removed} removed from Scene Graph")
         else:
             LOG.debug(f"Layer {uuid_removed} already removed from Scene Graph")
-        LOG.debug("Scene Graph after layer deletion:")
-        LOG.debug(self.main_view.describe_tree(with_transform=True))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scene Graph after layer deletion:")
+            LOG.debug(self.main_view.describe_tree(with_transform=True))
 
     def _connect_doc_signals(self, document: Document):
         document.didUpdateBasicDataset.connect(self.update_basic_dataset)  # new data integrated in existing layer